@@ -1,12 +1,23 @@
 """
 Async client for the HundredX API
+
+Independent reads can be fanned out concurrently over the shared connection pool;
+
+    async with AsyncHundredXClient(env, private_key) as client:
+        balances, positions, orders = await asyncio.gather(
+            client.get_spot_balances(),
+            client.get_position(),
+            client.get_open_orders(),
+        )
 """
 
-from typing import Any
+import asyncio
+from typing import Any, List
 
 import httpx
+import orjson
 
-from hundred_x.client import HundredXClient
+from hundred_x.client import HundredXClient, headers
 from hundred_x.exceptions import ClientError
 from hundred_x.utils import from_message_to_payload
 
@@ -16,6 +27,129 @@ class AsyncHundredXClient(HundredXClient):
     Asynchronous client for the HundredX API.
     """
 
+    _async_client: httpx.AsyncClient = None
+    _async_login_lock: asyncio.Lock = None
+
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        """
+        Lazily create the pooled async http client shared by all requests.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                headers=headers,
+                cookies=self._cookie_jar,
+                http2=self.http2,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=75),
+            )
+        return self._async_client
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Close the underlying http clients.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+        await asyncio.to_thread(self.close)
+
+    async def _request(self, method: str, endpoint: str, params: dict = None, content: bytes = None) -> httpx.Response:
+        """
+        Send a request to the REST api, logging in again once if the session expired.
+        """
+        session_cookie = self.session_cookie
+        response = await self.http_async_client.request(
+            method, self.rest_url + endpoint, params=params, content=content
+        )
+        if self._should_login_again(endpoint, response.status_code):
+            # the session expired, possibly a cached one, we login again and retry once.
+            if self._async_login_lock is None:
+                self._async_login_lock = asyncio.Lock()
+            # concurrent requests wait for a single login instead of each replacing the session.
+            async with self._async_login_lock:
+                if self.session_cookie == session_cookie:
+                    await asyncio.to_thread(self._login_again, session_cookie)
+            response = await self.http_async_client.request(
+                method, self.rest_url + endpoint, params=params, content=content
+            )
+        return response
+
+    async def _get(self, endpoint: str, params: dict = None) -> Any:
+        """
+        Send a GET request to an endpoint that is not routed through send_message_to_endpoint.
+        """
+        response = await self._request("GET", endpoint, params=params)
+        return orjson.loads(response.content)
+
+    async def list_products(self) -> List[Any]:
+        """
+        Get a list of all available products.
+        """
+        return await self._get("/v1/products")
+
+    async def get_product(self, product_symbol: str) -> Any:
+        """
+        Get the details of a specific product.
+        """
+        return await self._get(f"/v1/products/{product_symbol}")
+
+    async def get_server_time(self) -> Any:
+        """
+        Get the server time.
+        """
+        return await self._get("/v1/time")
+
+    async def get_candlestick(self, symbol: str, **kwargs) -> Any:
+        """
+        Get the candlestick data for a specific product.
+        """
+        params = {"symbol": symbol}
+        for arg in ["interval", "start_time", "end_time", "limit"]:
+            var = kwargs.get(arg)
+            if var is not None:
+                params[arg] = var
+        return await self._get("/v1/uiKlines", params=params)
+
+    async def get_session_status(self):
+        """
+        Get the current session status.
+        """
+        return await self._get("/v1/session/status")
+
+    async def logout(self):
+        """
+        Logout from the exchange.
+        """
+        response = await self._get("/v1/session/logout")
+        if getattr(self, "wallet", None):
+            self._delete_cached_session()
+        return response
+
+    async def get_approved_signers(self):
+        """
+        Get the approved signers.
+        """
+        return await self._get(
+            "/v1/approved-signers",
+            params={"account": self.public_key, "subAccountId": self.subaccount_id},
+        )
+
+    async def get_orders(self, symbol: str = None, ids: List[str] = None):
+        """
+        Get the orders.
+        """
+        params = {"account": self.public_key, "subAccountId": self.subaccount_id}
+        if ids is not None:
+            params["ids"] = ids
+        if symbol is not None:
+            params["symbol"] = symbol
+        return await self.send_message_to_endpoint("/v1/orders", "GET", params=params)
+
     async def get_symbol(self, symbol: str = None):
         """
         Get the symbol infos.
@@ -100,17 +234,7 @@ class AsyncHundredXClient(HundredXClient):
             raise ClientError(f"Invalid endpoint: {endpoint}")
         payload = from_message_to_payload(message)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method,
-                self.rest_url + endpoint,
-                params=params,
-                headers={} if not authenticated else self.authenticated_headers,
-                json=payload,
-            )
-
-            if response.status_code != 200:
-                raise Exception(
-                    f"Failed to send message: {response.text} {response.status_code} {self.rest_url} {payload}"
-                )
-            return response.json()
+        response = await self._request(method, endpoint, params=params, content=orjson.dumps(payload))
+        if response.status_code != 200:
+            raise Exception(f"Failed to send message: {response.text} {response.status_code} {self.rest_url} {payload}")
+        return orjson.loads(response.content)
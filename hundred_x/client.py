@@ -3,22 +3,43 @@
 Client class is a wrapper around the REST API of the exchange. It provides methods to interact with the exchange API.
 """
 
+import os
+import tempfile
+import threading
 import time
-from decimal import Decimal
-from typing import Any, List
+from http.cookiejar import CookieJar
+from pathlib import Path
+from typing import Any, List, Union
+from urllib.parse import urlencode, urlparse
+from urllib.request import Request
 
+import coincurve
 import eth_account
+import httpx
+import orjson
 import requests
+import urllib3
 from eip712_structs import make_domain
-from eth_account.messages import encode_structured_data
+from eth_abi import encode
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from urllib3.util.retry import Retry
 from web3 import Web3
-from web3.exceptions import TransactionNotFound
-
-from hundred_x.constants import APIS, CONTRACTS, LOGIN_MESSAGE, REFERRAL_CODE, RPC_URLS
+from web3.exceptions import TimeExhausted
+
+from hundred_x.constants import (
+    APIS,
+    CONTRACTS,
+    LOGIN_MESSAGE,
+    REFERRAL_CODE,
+    RPC_URLS,
+    SESSION_CACHE_DIR,
+    SESSION_CACHE_TTL,
+)
 from hundred_x.eip_712 import CancelOrder, CancelOrders, LoginMessage, Order, Referral, Withdraw
 from hundred_x.enums import ApiType, Environment, OrderSide, OrderType, TimeInForce
 from hundred_x.exceptions import ClientError, UserInputValidationError
-from hundred_x.utils import from_message_to_payload, get_abi
+from hundred_x.utils import DEFAULT_ENCODING, from_message_to_payload, get_abi, keccak, to_wei
 
 headers = {
     "Accept": "application/json",
@@ -26,8 +47,62 @@ headers = {
 }
 
 
+class LowLatencyResponse:
+    """
+    Minimal response exposing the attributes of a requests response used by the client.
+    """
+
+    def __init__(self, response: urllib3.HTTPResponse):
+        self.status_code = response.status
+        self.content = response.data
+        self.headers = response.headers
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(errors="replace")
+
+    def info(self):
+        # the cookie jar reads the Set-Cookie headers through info().get_all().
+        return self
+
+    def get_all(self, name: str, default=None):
+        return self.headers.getlist(name) or default
+
+
+class LowLatencyHTTP:
+    """
+    Http backend calling a urllib3 pool directly, skipping the per request overhead of requests.
+    """
+
+    def __init__(self):
+        self._pool = urllib3.PoolManager(num_pools=4, maxsize=32, block=False, retries=Retry(total=2))
+        self.cookies = RequestsCookieJar()
+
+    def request(self, method: str, url: str, params: dict = None, data: bytes = None) -> LowLatencyResponse:
+        if params:
+            url += "?" + urlencode({key: value for key, value in params.items() if value is not None}, doseq=True)
+        # the cookie jar only sends the cookies matching the domain and path of the request.
+        request = Request(url, method=method)
+        self.cookies.add_cookie_header(request)
+        cookie = request.get_header("Cookie")
+        request_headers = {**headers, "Cookie": cookie} if cookie else headers
+        response = LowLatencyResponse(self._pool.request(method, url, body=data, headers=request_headers))
+        self.cookies.extract_cookies(response, request)
+        return response
+
+    def close(self):
+        self._pool.clear()
+
+
 PROTOCOL_ABI = get_abi("protocol")
 ERC_20_ABI = get_abi("erc20")
+CONTRACT_ABIS = {
+    "USDB": ERC_20_ABI,
+    "PROTOCOL": PROTOCOL_ABI,
+}
+
+# orders expire one day after creation, expirations are expressed in microseconds.
+EXPIRATION_DELTA_US = 1000 * 60 * 60 * 24 * 1000
 
 
 class HundredXClient:
@@ -56,19 +131,28 @@ class HundredXClient:
         "/v1/ticker/24hr",
         "/v1/depth",
     ]
-
-    @property
-    def http_client(self):
-        return requests
+    _PRIVATE = frozenset(private_functions)
+    _PUBLIC = frozenset(public_functions)
+    _ALL = _PRIVATE | _PUBLIC
+    _ALL_ENDPOINTS_STR = ", ".join(sorted(_ALL))
+    # endpoints answering 401 once the session expired, the login and logout endpoints excluded.
+    _AUTHENTICATED = (_PRIVATE | {"/v1/session/status"}) - {"/v1/session/login", "/v1/session/logout"}
 
     def __init__(
         self,
         env: Environment = Environment.TESTNET,
         private_key: str = None,
         subaccount_id: int = 0,
+        http2: bool = False,
+        cache_session: bool = False,
+        low_latency: bool = False,
     ):
         """
         Initialize the client with the given environment.
+        If http2 is set, requests are multiplexed over a single HTTP/2 connection with httpx.
+        If low_latency is set, requests are sent through a bare urllib3 pool instead of requests.
+        If cache_session is set, the login session is persisted under HUNDRED_X_CACHE_DIR (~/.cache/hundred_x by
+        default) and reused by later clients until it expires or logout is called.
         """
         self.env = env
         self.rest_url = APIS[env][ApiType.REST]
@@ -79,6 +163,12 @@ class HundredXClient:
             )
 
         self.session_cookie = {}
+        self.http2 = http2
+        self.low_latency = low_latency
+        self.cache_session = cache_session
+        self._referral_thread = None
+        self._login_lock = threading.Lock()
+        self._session = self._create_http_session()
         self.web3 = Web3(Web3.HTTPProvider(RPC_URLS[env]))
         self.domain = make_domain(
             name="100x",
@@ -86,19 +176,106 @@ class HundredXClient:
             chainId=CONTRACTS[env]["CHAIN_ID"],
             verifyingContract=CONTRACTS[env]["VERIFYING_CONTRACT"],
         )
+        self._domain_separator = self.domain.hash_struct()
+        self._message_types = {
+            message_class: [(name, member.type_name) for name, member in message_class.get_members()]
+            for message_class in (Order, CancelOrder, CancelOrders, Withdraw, LoginMessage, Referral)
+        }
+        self._contract_addresses = {
+            name: Web3.to_checksum_address(address)
+            for name, address in CONTRACTS[env].items()
+            if isinstance(address, str)
+        }
+        self._contracts = {}
         if private_key:
             self.wallet = eth_account.Account.from_key(private_key)
+            self._signing_key = coincurve.PrivateKey(self.wallet.key)
             self.public_key = self.wallet.address
             if not (0 <= subaccount_id <= 255):
                 raise UserInputValidationError(
                     f"Subaccount ID must be between 0 and 255. It is instead: {subaccount_id}"
                 )
             self.subaccount_id = subaccount_id
-            self.login()
-            try:
-                self.set_referral_code()
-            except Exception:  # pylint: disable=broad-except
-                pass
+            if not self._load_cached_session():
+                self.login()
+                self._referral_thread = threading.Thread(target=self._set_referral_code_quietly)
+                self._referral_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Wait for the referral sent on login and close the underlying http session.
+        """
+        if self._referral_thread is not None:
+            self._referral_thread.join()
+            self._referral_thread = None
+        self._session.close()
+
+    def _create_http_session(self) -> Union[requests.Session, httpx.Client, LowLatencyHTTP]:
+        """
+        Create a pooled http session so connections are kept alive between calls.
+        """
+        if self.http2:
+            return httpx.Client(
+                http2=True,
+                headers=headers,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+            )
+        if self.low_latency:
+            return LowLatencyHTTP()
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504)),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(headers)
+        return session
+
+    @property
+    def _cookie_jar(self) -> CookieJar:
+        """
+        The cookie jar of the http session, shared with any other http client of this instance.
+        """
+        if isinstance(self._session, httpx.Client):
+            return self._session.cookies.jar
+        return self._session.cookies
+
+    def _send(self, method: str, endpoint: str, payload: dict = None, params: dict = None):
+        """
+        Send a request to the REST api through the configured http backend.
+        """
+        kwargs = {"params": params}
+        if payload is not None:
+            kwargs["content" if self.http2 else "data"] = orjson.dumps(payload)
+        session_cookie = self.session_cookie
+        response = self._session.request(method, self.rest_url + endpoint, **kwargs)
+        if self._should_login_again(endpoint, response.status_code):
+            # the session expired, possibly a cached one, we login again and retry once.
+            self._login_again(session_cookie)
+            response = self._session.request(method, self.rest_url + endpoint, **kwargs)
+        return response
+
+    def _should_login_again(self, endpoint: str, status_code: int) -> bool:
+        """
+        Check if a response means the session expired and can be renewed.
+        """
+        return status_code == 401 and endpoint in self._AUTHENTICATED and bool(getattr(self, "wallet", None))
+
+    def _login_again(self, expired_session_cookie: str):
+        """
+        Login again, unless a concurrent call already replaced the expired session.
+        """
+        with self._login_lock:
+            if self.session_cookie == expired_session_cookie:
+                self.login()
 
     def _validate_function(
         self,
@@ -107,32 +284,54 @@ class HundredXClient:
         """
         Check if the endpoint is a private function.
         """
-        if endpoint not in self.private_functions + self.public_functions:
-            raise ClientError(f"Invalid endpoint: {endpoint} Not in {self.private_functions + self.public_functions}")
-        if endpoint in self.public_functions:
-            return True
-        if endpoint in self.private_functions:
-            if not self.wallet:
-                raise UserInputValidationError(
-                    f"Private function {endpoint} requires a private key please provide one at initialization."
-                )
+        if endpoint in self._PUBLIC:
             return True
+        if endpoint not in self._PRIVATE:
+            raise ClientError(f"Invalid endpoint: {endpoint} Not in {self._ALL_ENDPOINTS_STR}")
+        if not getattr(self, "wallet", None):
+            raise UserInputValidationError(
+                f"Private function {endpoint} requires a private key please provide one at initialization."
+            )
+        return True
 
     def _current_timestamp(self):
-        timestamp_ms = int(time.time() * 1000)
-        return timestamp_ms
+        return time.time_ns() // 1_000_000
 
     def generate_and_sign_message(self, message_class, **kwargs):
         """
         Generate and sign a message.
         """
 
-        message = message_class(**kwargs)
-        message = message.to_message(self.domain)
-        signable_message = encode_structured_data(message)
-        signed = self.wallet.sign_message(signable_message)
-        message["message"]["signature"] = signed.signature.hex()
-        return message["message"]
+        message = {}
+        for name, type_name in self._message_types[message_class]:
+            if kwargs.get(name) is None:
+                raise UserInputValidationError(f"Missing value for field {name} of type {type_name}.")
+            message[name] = kwargs[name]
+        struct_hash = keccak(message_class.TYPE_HASH + self._encode_data(message_class, message))
+        digest = keccak(b"\x19\x01" + self._domain_separator + struct_hash)
+        message["signature"] = self._sign_digest(digest)
+        return message
+
+    def _encode_data(self, message_class, message: dict) -> bytes:
+        """
+        EIP-712 encodeData of a flat struct, dynamic strings are replaced by their keccak hash.
+        """
+        types, values = [], []
+        for name, type_name in self._message_types[message_class]:
+            if type_name == "string":
+                types.append("bytes32")
+                values.append(keccak(message[name].encode(DEFAULT_ENCODING)))
+            else:
+                types.append(type_name)
+                values.append(message[name])
+        return encode(types, values)
+
+    def _sign_digest(self, digest: bytes) -> str:
+        """
+        Sign a 32 byte EIP-712 digest and return the hex encoded r || s || v signature.
+        """
+        signature = self._signing_key.sign_recoverable(digest, hasher=None)
+        return Web3.to_hex(signature[:64] + bytes([signature[64] + 27]))
 
     def get_shared_params(self, asset: str = None, subaccount_id: int = None):
         params = {
@@ -155,16 +354,10 @@ class HundredXClient:
         ):
             raise ClientError(f"Invalid endpoint: {endpoint}")
         payload = from_message_to_payload(message)
-        response = self.http_client.request(
-            method,
-            self.rest_url + endpoint,
-            params=params,
-            headers={} if not authenticated else self.authenticated_headers,
-            json=payload,
-        )
+        response = self._send(method, endpoint, payload=payload, params=params)
         if response.status_code != 200:
             raise Exception(f"Failed to send message: {response.text} {response.status_code} {self.rest_url} {payload}")
-        return response.json()
+        return orjson.loads(response.content)
 
     def withdraw(self, subaccount_id: int, quantity: int, asset: str = "USDB"):
         """
@@ -173,7 +366,7 @@ class HundredXClient:
 
         message = self.generate_and_sign_message(
             Withdraw,
-            quantity=int(quantity * 1e18),
+            quantity=to_wei(quantity),
             nonce=self._current_timestamp(),
             **self.get_shared_params(subaccount_id=subaccount_id, asset=asset),
         )
@@ -202,16 +395,16 @@ class HundredXClient:
         params = {
             "subAccountId": subaccount_id,
             "productId": product_id,
-            "quantity": int(Decimal(str(quantity)) * Decimal(1e18)),
+            "quantity": to_wei(quantity),
             "isBuy": side.value,
             "orderType": order_type.value,
             "timeInForce": time_in_force.value,
             "nonce": nonce,
-            "expiration": (ts + 1000 * 60 * 60 * 24) * 1000,
+            "expiration": ts * 1000 + EXPIRATION_DELTA_US,
             **self.get_shared_params(),
         }
         if price is not None:
-            params["price"] = int(Decimal(str(price)) * Decimal(1e18))
+            params["price"] = to_wei(price)
         message = self.generate_and_sign_message(
             Order,
             **params,
@@ -242,13 +435,13 @@ class HundredXClient:
             Order,
             subAccountId=subaccount_id,
             productId=product_id,
-            quantity=int(Decimal(str(quantity)) * Decimal(1e18)),
-            price=int(Decimal(str(price)) * Decimal(1e18)),
+            quantity=to_wei(quantity),
+            price=to_wei(price),
             isBuy=side.value,
             orderType=order_type.value,
             timeInForce=time_in_force.value,
             nonce=nonce,
-            expiration=(ts + 1000 * 60 * 60 * 24) * 1000,
+            expiration=ts * 1000 + EXPIRATION_DELTA_US,
             **self.get_shared_params(),
         )
         message = {}
@@ -288,24 +481,84 @@ class HundredXClient:
             timestamp=self._current_timestamp(),
             **self.get_shared_params(),
         )
-        response = requests.post(
-            self.rest_url + "/v1/session/login",
-            json=login_payload,
-        ).json()
-        self.session_cookie = response.get("value")
+        response = self._send("POST", "/v1/session/login", payload=login_payload)
+        response = orjson.loads(response.content)
+        self._set_session_cookie(response.get("value"))
+        if self.cache_session and self.session_cookie:
+            self._save_cached_session()
         return response
 
+    def _set_session_cookie(self, session_cookie: str):
+        self.session_cookie = session_cookie
+        # the cookie jar matches a dotless host such as localhost as <host>.local, the cookie can't be scoped to it.
+        hostname = urlparse(self.rest_url).hostname
+        self._session.cookies.set("connectedAddress", session_cookie, domain=hostname if "." in hostname else "")
+
+    @property
+    def _session_cache_path(self) -> Path:
+        cache_dir = Path(SESSION_CACHE_DIR) if SESSION_CACHE_DIR else Path.home() / ".cache" / "hundred_x"
+        return cache_dir / f"{self.env.value}_{self.public_key}.json"
+
+    def _load_cached_session(self) -> bool:
+        """
+        Reuse an unexpired session persisted by a previous client, return whether one was found.
+        """
+        if not self.cache_session:
+            return False
+        try:
+            cached = orjson.loads(self._session_cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return False
+        if cached.get("address") != self.public_key or cached.get("expires_at", 0) <= time.time():
+            return False
+        self._set_session_cookie(cached["session_cookie"])
+        return True
+
+    def _delete_cached_session(self):
+        """
+        Forget the persisted session.
+        """
+        try:
+            self._session_cache_path.unlink()
+        except OSError:
+            pass
+
+    def _save_cached_session(self):
+        """
+        Persist the current session, readable by the current user only.
+        """
+        cached = {
+            "address": self.public_key,
+            "subaccount_id": self.subaccount_id,
+            "session_cookie": self.session_cookie,
+            "expires_at": time.time() + SESSION_CACHE_TTL,
+        }
+        path = self._session_cache_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # mkstemp creates the file with mode 0600, replacing the cache with it never exposes a partial write.
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(cached))
+                os.replace(temp_path, path)
+            except OSError:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            pass
+
     def list_products(self) -> List[Any]:
         """
         Get a list of all available products.
         """
-        return requests.get(self.rest_url + "/v1/products").json()
+        return orjson.loads(self._send("GET", "/v1/products").content)
 
     def get_product(self, product_symbol: str) -> Any:
         """
         Get the details of a specific product.
         """
-        return requests.get(self.rest_url + f"/v1/products/{product_symbol}").json()
+        return orjson.loads(self._send("GET", f"/v1/products/{product_symbol}").content)
 
     def get_account_health(self) -> Any:
         """
@@ -332,7 +585,7 @@ class HundredXClient:
         """
         Get the server time.
         """
-        return requests.get(self.rest_url + "/v1/time").json()
+        return orjson.loads(self._send("GET", "/v1/time").content)
 
     def get_candlestick(self, symbol: str, **kwargs) -> Any:
         """
@@ -343,10 +596,8 @@ class HundredXClient:
             var = kwargs.get(arg)
             if var is not None:
                 params[arg] = var
-        return requests.get(
-            self.rest_url + "/v1/uiKlines",
-            params=params,
-        ).json()
+        response = self._send("GET", "/v1/uiKlines", params=params)
+        return orjson.loads(response.content)
 
     def get_symbol(self, symbol: str = None) -> Any:
         """
@@ -393,19 +644,17 @@ class HundredXClient:
         """
         Get the current session status.
         """
-        return requests.get(self.rest_url + "/v1/session/status", headers=self.authenticated_headers).json()
-
-    @property
-    def authenticated_headers(self):
-        return {
-            "cookie": f"connectedAddress={self.session_cookie}",
-        }
+        response = self._send("GET", "/v1/session/status")
+        return orjson.loads(response.content)
 
     def logout(self):
         """
         Logout from the exchange.
         """
-        return requests.get(self.rest_url + "/v1/session/logout", headers=self.authenticated_headers).json()
+        response = self._send("GET", "/v1/session/logout")
+        if getattr(self, "wallet", None):
+            self._delete_cached_session()
+        return orjson.loads(response.content)
 
     def get_spot_balances(self):
         """
@@ -431,11 +680,12 @@ class HundredXClient:
         """
         Get the approved signers.
         """
-        return requests.get(
-            self.rest_url + "/v1/approved-signers",
-            headers=self.authenticated_headers,
+        response = self._send(
+            "GET",
+            "/v1/approved-signers",
             params={"account": self.public_key, "subAccountId": self.subaccount_id},
-        ).json()
+        )
+        return orjson.loads(response.content)
 
     def get_open_orders(
         self,
@@ -460,16 +710,12 @@ class HundredXClient:
         if symbol is not None:
             params["symbol"] = symbol
 
-        response = requests.get(
-            self.rest_url + "/v1/orders",
-            headers=self.authenticated_headers,
-            params=params,
-        )
+        response = self._send("GET", "/v1/orders", params=params)
         if response.status_code != 200:
             raise Exception(
                 f"Failed to get orders: {response.text} {response.status_code} " + f"{self.rest_url} {params}"
             )
-        return response.json()
+        return orjson.loads(response.content)
 
     def set_referral_code(self):
         """
@@ -481,41 +727,45 @@ class HundredXClient:
             **self.get_shared_params(),
         )
         try:
-            requests.post(
-                self.rest_url + "/v1/referral/add-referee",
-                headers=self.authenticated_headers,
-                json=referral_payload,
-            )
+            self._send("POST", "/v1/referral/add-referee", payload=referral_payload)
         except Exception as e:
             if "user already referred" in str(e):
                 return
             raise e
 
+    def _set_referral_code_quietly(self):
+        try:
+            self.set_referral_code()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
     def deposit(self, subaccount_id: int, quantity: int, asset: str = "USDB"):
         """
         Deposit an asset.
         """
         # we need to check if we have sufficient balance to deposit
-        required_wei = int(Decimal(str(quantity)) * Decimal(1e18))
+        required_wei = to_wei(quantity)
         # we check the approvals
         asset_contract = self.get_contract(asset)
 
         approved_amount = asset_contract.functions.allowance(
             self.public_key, self.get_contract_address("PROTOCOL")
         ).call()
+        nonce = self.web3.eth.get_transaction_count(self.public_key)
         if approved_amount < required_wei:
             txn = asset_contract.functions.approve(
                 self.get_contract_address("PROTOCOL"), required_wei
             ).build_transaction(
                 {
                     "from": self.public_key,
-                    "nonce": self.web3.eth.get_transaction_count(self.public_key),
+                    "nonce": nonce,
                 }
             )
             signed_txn = self.wallet.sign_transaction(txn)
             result = self.web3.eth.send_raw_transaction(signed_txn.rawTransaction)
             # we wait for the transaction to be mined
             self.wait_for_transaction(result)
+            nonce += 1
 
         protocol_contract = self.get_contract("PROTOCOL")
         txn = protocol_contract.functions.deposit(
@@ -526,7 +776,7 @@ class HundredXClient:
         ).build_transaction(
             {
                 "from": self.public_key,
-                "nonce": self.web3.eth.get_transaction_count(self.public_key),
+                "nonce": nonce,
             }
         )
         signed_txn = self.wallet.sign_transaction(txn)
@@ -534,33 +784,28 @@ class HundredXClient:
         return self.wait_for_transaction(result)
 
     def wait_for_transaction(self, txn_hash, timeout=60):
-        while True:
-            if timeout == 0:
-                raise Exception("Timeout")
-            try:
-                receipt = self.web3.eth.get_transaction_receipt(txn_hash)
-                if receipt is not None:
-                    break
-            except TransactionNotFound:
-                time.sleep(1)
-            timeout -= 1
+        """
+        Wait for a transaction to be mined and return whether it succeeded.
+        """
+        try:
+            receipt = self.web3.eth.wait_for_transaction_receipt(txn_hash, timeout=timeout, poll_latency=0.2)
+        except TimeExhausted as error:
+            raise Exception("Timeout") from error
         return receipt["status"] == 1
 
     def get_contract_address(self, name: str):
         """
         Get the contract address for a specific asset.
         """
-        return self.web3.to_checksum_address(CONTRACTS[self.env][name])
+        return self._contract_addresses[name]
 
     def get_contract(self, name: str):
         """
         Get the contract for a specific asset.
         """
-        abis = {
-            "USDB": ERC_20_ABI,
-            "PROTOCOL": PROTOCOL_ABI,
-        }
-        return self.web3.eth.contract(
-            address=self.get_contract_address(name),
-            abi=abis[name],
-        )
+        if name not in self._contracts:
+            self._contracts[name] = self.web3.eth.contract(
+                address=self.get_contract_address(name),
+                abi=CONTRACT_ABIS[name],
+            )
+        return self._contracts[name]
@@ -41,6 +41,10 @@ RPC_URLS = {
 
 LOGIN_MESSAGE = "I would like to login to 100x finance."
 
+# defaults to ~/.cache/hundred_x, resolved when a session is cached.
+SESSION_CACHE_DIR = os.getenv("HUNDRED_X_CACHE_DIR", None)
+SESSION_CACHE_TTL = 60 * 60 * 24
+
 CONTRACTS = {
     Environment.PROD: {
         "USDB": "0x4300000000000000000000000000000000000003",
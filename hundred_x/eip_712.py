@@ -5,14 +5,22 @@ Eip structs for the hundred_x project
 
 from eip712_structs import Address, Boolean, EIP712Struct, String, Uint
 
+from hundred_x.utils import keccak
+
 
 class LoginMessage(EIP712Struct):
+    ENCODE_TYPE: bytes = b"LoginMessage(address account,string message,uint64 timestamp)"
+    TYPE_HASH: bytes = keccak(ENCODE_TYPE)
+
     account = Address()
     message = String()
     timestamp = Uint(64)
 
 
 class Withdraw(EIP712Struct):
+    ENCODE_TYPE: bytes = b"Withdraw(address account,uint8 subAccountId,address asset,uint128 quantity,uint64 nonce)"
+    TYPE_HASH: bytes = keccak(ENCODE_TYPE)
+
     account = Address()
     subAccountId = Uint(8)
     asset = Address()
@@ -21,6 +29,12 @@ class Withdraw(EIP712Struct):
 
 
 class Order(EIP712Struct):
+    ENCODE_TYPE: bytes = (
+        b"Order(address account,uint8 subAccountId,uint32 productId,"
+        b"bool isBuy,uint8 orderType,uint8 timeInForce,uint64 expiration,uint128 price,uint128 quantity,uint64 nonce)"
+    )
+    TYPE_HASH: bytes = keccak(ENCODE_TYPE)
+
     account = Address()
     subAccountId = Uint(8)
     productId = Uint(32)
@@ -34,6 +48,9 @@ class Order(EIP712Struct):
 
 
 class CancelOrder(EIP712Struct):
+    ENCODE_TYPE: bytes = b"CancelOrder(address account,uint8 subAccountId,uint32 productId,string orderId)"
+    TYPE_HASH: bytes = keccak(ENCODE_TYPE)
+
     account = Address()
     subAccountId = Uint(8)
     productId = Uint(32)
@@ -41,11 +58,17 @@ class CancelOrder(EIP712Struct):
 
 
 class CancelOrders(EIP712Struct):
+    ENCODE_TYPE: bytes = b"CancelOrders(address account,uint8 subAccountId,uint32 productId)"
+    TYPE_HASH: bytes = keccak(ENCODE_TYPE)
+
     account = Address()
     subAccountId = Uint(8)
     productId = Uint(32)
 
 
 class Referral(EIP712Struct):
+    ENCODE_TYPE: bytes = b"Referral(address account,string code)"
+    TYPE_HASH: bytes = keccak(ENCODE_TYPE)
+
     account = Address()
     code = String()
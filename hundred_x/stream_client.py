@@ -0,0 +1,150 @@
+"""
+Streaming client for the HundredX websocket API.
+
+Market data is pushed over a single persistent websocket instead of polling the REST endpoints;
+
+    async with HundredXStreamClient(Environment.PROD) as stream:
+        async for book in stream.subscribe_depth("btcperp"):
+            ...
+"""
+
+import asyncio
+import contextlib
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, List
+
+import orjson
+import websockets
+
+from hundred_x.constants import APIS
+from hundred_x.enums import ApiType, Environment
+from hundred_x.exceptions import UserInputValidationError
+
+
+class HundredXStreamClient:
+    """
+    Asynchronous websocket client dispatching stream frames to per-stream subscribers.
+    """
+
+    def __init__(self, env: Environment = Environment.TESTNET):
+        """
+        Initialize the stream client with the given environment.
+        """
+        self.env = env
+        websocket_url = APIS[env][ApiType.WEBSOCKET]
+        if not websocket_url:
+            raise UserInputValidationError(f"Invalid environment: {env} Missing WEBSOCKET URL for the environment.")
+        self.websocket_url = websocket_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+        self._connection = None
+        self._reader = None
+        self._queues: Dict[str, List[asyncio.Queue]] = defaultdict(list)
+        self._request_id = 0
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def connect(self):
+        """
+        Open the websocket connection and start dispatching incoming frames.
+        """
+        self._connection = await websockets.connect(self.websocket_url)
+        self._reader = asyncio.create_task(self._read())
+
+    async def close(self):
+        """
+        Close the websocket connection.
+        """
+        if self._connection is not None:
+            await self._connection.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+        self._connection = None
+        self._reader = None
+
+    async def _read(self):
+        """
+        Dispatch the data of every stream frame to the queues subscribed to that stream.
+        """
+        connection = self._connection
+        error = None
+        try:
+            async for frame in connection:
+                message = orjson.loads(frame)
+                if not isinstance(message, dict):
+                    continue
+                data = message.get("data")
+                if data is None:
+                    # subscription acknowledgements and errors carry no data.
+                    continue
+                for queue in self._queues.get(message.get("stream"), ()):
+                    queue.put_nowait(data)
+        except Exception as e:  # pylint: disable=broad-except
+            # the connection dropped or sent an invalid frame, the subscribers raise it.
+            error = e
+            await connection.close()
+        finally:
+            if self._connection is connection:
+                # the next subscription opens a new connection.
+                self._connection = None
+                self._reader = None
+            # wake up the subscribers so they stop once the connection is gone.
+            for queues in self._queues.values():
+                for queue in queues:
+                    queue.put_nowait(error)
+
+    async def _send(self, method: str, streams: List[str]):
+        self._request_id += 1
+        request = {"method": method, "params": streams, "id": self._request_id}
+        await self._connection.send(orjson.dumps(request).decode())
+
+    async def subscribe(self, stream: str) -> AsyncIterator[Any]:
+        """
+        Subscribe to a stream and yield the data of each of its frames.
+        Stops when the client is closed, raises the error of the connection if it dropped.
+        """
+        if self._connection is None:
+            await self.connect()
+        queue = asyncio.Queue()
+        subscribers = self._queues[stream]
+        subscribers.append(queue)
+        subscribed = False
+        try:
+            if len(subscribers) == 1:
+                await self._send("SUBSCRIBE", [stream])
+            subscribed = True
+            while True:
+                data = await queue.get()
+                if data is None:
+                    return
+                if isinstance(data, Exception):
+                    raise data
+                yield data
+        finally:
+            subscribers.remove(queue)
+            if not subscribers:
+                del self._queues[stream]
+                if subscribed and self._connection is not None and self._reader is not None and not self._reader.done():
+                    with contextlib.suppress(websockets.ConnectionClosed):
+                        await self._send("UNSUBSCRIBE", [stream])
+
+    def subscribe_depth(self, symbol: str) -> AsyncIterator[Any]:
+        """
+        Stream the order book depth for a specific symbol.
+        """
+        return self.subscribe(f"{symbol}@depth")
+
+    def subscribe_trades(self, symbol: str) -> AsyncIterator[Any]:
+        """
+        Stream the trades for a specific symbol.
+        """
+        return self.subscribe(f"{symbol}@trade")
+
+    def subscribe_klines(self, symbol: str, interval: str) -> AsyncIterator[Any]:
+        """
+        Stream the candlesticks for a specific symbol and interval.
+        """
+        return self.subscribe(f"{symbol}@kline_{interval}")
@@ -2,16 +2,32 @@
 Utils module for hundred_x package.
 """
 
-import json
 import os
+from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+from eth_hash import Keccak256
+
 from hundred_x.enums import Environment
+from hundred_x.exceptions import UserInputValidationError
 
 INSTALL_DIR = os.path.dirname(os.path.abspath(__file__))
 DEFAULT_ENCODING = "utf-8"
 
+WEI = Decimal(10) ** 18
+
+try:
+    # eth-hash picks pycryptodome first when both are installed, the pysha3 C extension is several times faster.
+    # The backend is only chosen for the hashes of this package, eth-hash's own selection is left untouched.
+    from eth_hash.backends import pysha3
+except ImportError:
+    from eth_hash.auto import keccak
+else:
+    keccak = Keccak256(pysha3)
+
 STRING_KEYS = [
     "price",
     "quantity",
@@ -22,15 +38,23 @@ def get_base_url(envirnment: Environment):
     """Map the environment to the corresponding base URL."""
 
 
+@lru_cache(maxsize=None)
 def get_abi(contract_name: str):
     """Get the ABI of the contract."""
-    with open(Path(INSTALL_DIR) / "abis" / f"{contract_name}.json", "r", encoding=DEFAULT_ENCODING) as f:
-        return json.load(f)
+    return orjson.loads((Path(INSTALL_DIR) / "abis" / f"{contract_name}.json").read_bytes())
 
 
 def from_message_to_payload(message: Dict[str, Any]):
-    """Convert a message to a payload."""
-    for key, value in message.items():
-        if key in STRING_KEYS:
-            message[key] = str(value)
-    return message
+    """Convert a message to a payload without mutating the original message."""
+    return {key: str(value) if key in STRING_KEYS else value for key, value in message.items()}
+
+
+def to_wei(value: Any) -> int:
+    """Scale a human readable amount to its 18 decimal integer representation."""
+    if isinstance(value, bool):
+        raise UserInputValidationError(f"Invalid amount: {value!r} booleans are not amounts.")
+    if isinstance(value, int):
+        return value * 10**18
+    if isinstance(value, Decimal):
+        return int(value * WEI)
+    return int(Decimal(str(value)) * WEI)
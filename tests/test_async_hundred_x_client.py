@@ -92,3 +92,11 @@ async def test_cancel_order(client):
     ).mock(return_value=Response(200, json={"orderId": TEST_ORDER_ID}))
     response = await client.cancel_order(order_id=TEST_ORDER_ID, product_id=1002)
     assert response["orderId"] == TEST_ORDER_ID
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_list_products(client):
+    respx.get(f"{client.rest_url}/v1/products").mock(return_value=Response(200, json=[{"symbol": TEST_SYMBOL}]))
+    response = await client.list_products()
+    assert response[0]["symbol"] == TEST_SYMBOL
@@ -0,0 +1,142 @@
+"""
+Offline tests for the EIP-712 signing of the hundred_x.client module.
+"""
+
+from unittest import mock
+
+import pytest
+from eip712_structs import make_domain
+from eth_account.messages import encode_structured_data
+
+from hundred_x.client import HundredXClient
+from hundred_x.constants import CONTRACTS
+from hundred_x.eip_712 import CancelOrder, CancelOrders, LoginMessage, Order, Referral, Withdraw
+from hundred_x.enums import Environment
+from hundred_x.exceptions import UserInputValidationError
+from tests.test_data import TEST_ORDER, TEST_PRIVATE_KEY
+
+WITHDRAW_SIGNATURES = {
+    Environment.PROD: "0x04a512b60f41f4429d030f1dea3d29544e28fad573582e033d55da25ef6c2e8153ca256637088369de25dbcbb8f2bde7e2fe3fb193240c3f3fd90169858999f81c",  # noqa: E501
+    Environment.TESTNET: "0x716869414978aae79b4dbed32d27c68002ed9070967c2026466e7af5c07b4f5a24ee2b333201f48b2257766aca45b99f31709b778acce5e71747d7a1be3026121b",  # noqa: E501
+}
+ORDER_SIGNATURES = {
+    Environment.PROD: "0x38c34757dd73104595871b471143d4ce0d95eec7d020e4950830921cb0eec0427ef284dfc6fc5c65b2319179a73d16f84f5d6a1d2e0d1a301caa665112d440601c",  # noqa: E501
+    Environment.TESTNET: "0xb7f6141dad52ff2a26c5834313dc07fac85ee66ce44997204c4df995447523e254f60b1eb0b7537158b4f23d5e648cffed503c29e05b972d4c100ce6680d4b611c",  # noqa: E501
+}
+
+
+def offline_client(env: Environment) -> HundredXClient:
+    """
+    Create a client with the test key without logging in.
+    """
+    with mock.patch.object(HundredXClient, "login"), mock.patch.object(HundredXClient, "set_referral_code"):
+        return HundredXClient(env=env, private_key=TEST_PRIVATE_KEY, subaccount_id=1, cache_session=False)
+
+
+def messages(client: HundredXClient):
+    """
+    One message of each signed struct.
+    """
+    account = client.public_key
+    return [
+        (
+            Order,
+            dict(
+                account=account,
+                subAccountId=1,
+                productId=1002,
+                isBuy=True,
+                orderType=0,
+                timeInForce=0,
+                expiration=(1711722373 + 1000 * 60 * 60 * 24) * 1000,
+                price=3000 * 10**18,
+                quantity=10**18,
+                nonce=1711722373,
+            ),
+        ),
+        (CancelOrder, dict(account=account, subAccountId=1, productId=1002, orderId="0xabc123")),
+        (CancelOrders, dict(account=account, subAccountId=1, productId=1002)),
+        (
+            Withdraw,
+            dict(
+                account=account,
+                subAccountId=1,
+                asset=client.get_contract_address("USDB"),
+                quantity=100 * 10**18,
+                nonce=1711722371,
+            ),
+        ),
+        (LoginMessage, dict(account=account, message="I would like to login to 100x finance.", timestamp=1711722371)),
+        (Referral, dict(account=account, code="8baller")),
+    ]
+
+
+@pytest.mark.parametrize("env", [Environment.PROD, Environment.TESTNET])
+def test_matches_eip712_structs(env):
+    """
+    Test the messages are signed exactly as encode_structured_data and sign_message would sign them.
+    """
+    client = offline_client(env)
+    domain = make_domain(
+        name="100x",
+        version="0.0.0",
+        chainId=CONTRACTS[env]["CHAIN_ID"],
+        verifyingContract=CONTRACTS[env]["VERIFYING_CONTRACT"],
+    )
+    for message_class, values in messages(client):
+        structured = message_class(**values).to_message(domain)
+        expected = dict(structured["message"])
+        expected["signature"] = client.wallet.sign_message(encode_structured_data(structured)).signature.hex()
+
+        message = client.generate_and_sign_message(message_class, **values)
+
+        assert message == expected, message_class.__name__
+        assert list(message) == list(expected), message_class.__name__
+
+
+@pytest.mark.parametrize("env", [Environment.PROD, Environment.TESTNET])
+def test_withdraw_signature(env):
+    """
+    Test the withdraw signature against the pinned signature.
+    """
+    client = offline_client(env)
+    message = client.generate_and_sign_message(
+        message_class=Withdraw,
+        quantity=int(100 * 10**18),
+        nonce=1711722371,
+        **client.get_shared_params(subaccount_id=1, asset="USDB"),
+    )
+    assert message["signature"] == WITHDRAW_SIGNATURES[env]
+
+
+@pytest.mark.parametrize("env", [Environment.PROD, Environment.TESTNET])
+def test_order_signature(env):
+    """
+    Test the order signature against the pinned signature.
+    """
+    client = offline_client(env)
+    ts = 1711722373
+    message = client.generate_and_sign_message(
+        message_class=Order,
+        expiration=(ts + 1000 * 60 * 60 * 24) * 1000,
+        nonce=ts,
+        productId=TEST_ORDER["product_id"],
+        isBuy=TEST_ORDER["side"].value,
+        orderType=TEST_ORDER["order_type"].value,
+        price=TEST_ORDER["price"] * 10**18,
+        quantity=TEST_ORDER["quantity"] * 10**18,
+        timeInForce=TEST_ORDER["time_in_force"].value,
+        **client.get_shared_params(subaccount_id=TEST_ORDER["subaccount_id"], asset="USDB"),
+    )
+    assert message["signature"] == ORDER_SIGNATURES[env]
+
+
+def test_missing_field():
+    """
+    Test a missing field is reported by name.
+    """
+    client = offline_client(Environment.PROD)
+    values = dict(messages(client))[Order]
+    del values["price"]
+    with pytest.raises(UserInputValidationError, match="price"):
+        client.generate_and_sign_message(Order, **values)
@@ -0,0 +1,61 @@
+"""
+Tests for the client over HTTP/2.
+"""
+
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import orjson
+import pytest
+import respx
+from httpx import Response
+
+from hundred_x.client import HundredXClient
+from hundred_x.eip_712 import Order
+from hundred_x.enums import Environment
+from tests.test_data import TEST_ADDRESS, TEST_ORDER, TEST_PRIVATE_KEY, TEST_SYMBOL
+
+SESSION_COOKIE = "test-session"
+
+
+@pytest.fixture
+def client():
+    with respx.mock(base_url="https://api.100x.finance") as router:
+        router.post("/v1/session/login").mock(return_value=Response(200, json={"value": SESSION_COOKIE}))
+        with mock.patch.object(HundredXClient, "set_referral_code"):
+            client = HundredXClient(Environment.PROD, TEST_PRIVATE_KEY, subaccount_id=1, http2=True)
+        client.router = router
+        yield client
+        client.close()
+
+
+def test_http2_session(client):
+    assert client._session._transport._pool._http2
+
+
+def test_get_orders(client):
+    route = client.router.get("/v1/orders").mock(return_value=Response(200, json=[{"id": "a"}]))
+    response = client.get_orders(symbol=TEST_SYMBOL, ids=["a", "b"])
+    assert response == [{"id": "a"}]
+    request = route.calls.last.request
+    assert parse_qs(urlparse(str(request.url)).query) == {
+        "account": [TEST_ADDRESS],
+        "subAccountId": ["1"],
+        "ids": ["a", "b"],
+        "symbol": [TEST_SYMBOL],
+    }
+    assert request.headers["cookie"] == f"connectedAddress={SESSION_COOKIE}"
+
+
+def test_create_order(client):
+    route = client.router.post("/v1/order").mock(return_value=Response(200, json={"id": "a"}))
+    client._current_timestamp = lambda: 1711722373
+    assert client.create_order(**TEST_ORDER) == {"id": "a"}
+    request = route.calls.last.request
+    assert request.headers["cookie"] == f"connectedAddress={SESSION_COOKIE}"
+    payload = orjson.loads(request.content)
+    assert payload["price"] == str(3000 * 10**18)
+    assert payload["quantity"] == str(10**18)
+    message = {key: int(value) if key in ("price", "quantity") else value for key, value in payload.items()}
+    del message["signature"]
+    assert client.generate_and_sign_message(Order, **message)["signature"] == payload["signature"]
@@ -0,0 +1,74 @@
+"""
+Offline tests for the urllib3 http backend of the client.
+"""
+
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import orjson
+import pytest
+import urllib3
+
+from hundred_x.client import HundredXClient, LowLatencyHTTP
+from hundred_x.enums import Environment
+from tests.test_data import TEST_ADDRESS, TEST_PRIVATE_KEY, TEST_SYMBOL
+
+REST_URL = "https://api.100x.finance"
+
+
+def response(body=None, status=200, headers=None):
+    return urllib3.HTTPResponse(
+        body=orjson.dumps(body if body is not None else {}), status=status, headers=headers, preload_content=True
+    )
+
+
+@pytest.fixture
+def pool_request():
+    with mock.patch.object(urllib3.PoolManager, "request", return_value=response()) as pool_request:
+        yield pool_request
+
+
+def test_query_and_body(pool_request):
+    http = LowLatencyHTTP()
+    pool_request.return_value = response({"id": "a"})
+    result = http.request(
+        "POST", f"{REST_URL}/v1/orders", params={"symbol": TEST_SYMBOL, "ids": ["a", "b"], "limit": None}, data=b"{}"
+    )
+    assert result.status_code == 200
+    assert orjson.loads(result.content) == {"id": "a"}
+    method, url = pool_request.call_args.args
+    assert method == "POST"
+    assert parse_qs(urlparse(url).query) == {"symbol": [TEST_SYMBOL], "ids": ["a", "b"]}
+    assert pool_request.call_args.kwargs["body"] == b"{}"
+    assert "Cookie" not in pool_request.call_args.kwargs["headers"]
+
+
+def test_cookies(pool_request):
+    http = LowLatencyHTTP()
+    http.cookies.set("connectedAddress", "session", domain="api.100x.finance")
+    http.cookies.set("other", "value", domain="api.staging.100x.finance")
+    http.cookies.set("scoped", "value", domain="api.100x.finance", path="/v1/session")
+    pool_request.return_value = response(headers={"Set-Cookie": "refreshed=yes; Path=/"})
+
+    http.request("GET", f"{REST_URL}/v1/products")
+    assert pool_request.call_args.kwargs["headers"]["Cookie"] == "connectedAddress=session"
+
+    http.request("GET", f"{REST_URL}/v1/session/status")
+    cookies = pool_request.call_args.kwargs["headers"]["Cookie"].split("; ")
+    assert sorted(cookies) == ["connectedAddress=session", "refreshed=yes", "scoped=value"]
+    assert http.cookies.get("refreshed", domain="api.100x.finance") == "yes"
+
+
+def test_client(pool_request):
+    pool_request.return_value = response({"value": "session"})
+    with mock.patch.object(HundredXClient, "set_referral_code"):
+        client = HundredXClient(Environment.PROD, TEST_PRIVATE_KEY, subaccount_id=1, low_latency=True)
+    login_body = orjson.loads(pool_request.call_args.kwargs["body"])
+    assert login_body["account"] == TEST_ADDRESS
+
+    pool_request.return_value = response([])
+    assert client.get_orders(ids=["a", "b"]) == []
+    method, url = pool_request.call_args.args
+    assert parse_qs(urlparse(url).query) == {"account": [TEST_ADDRESS], "subAccountId": ["1"], "ids": ["a", "b"]}
+    assert pool_request.call_args.kwargs["headers"]["Cookie"] == "connectedAddress=session"
+    client.close()
@@ -0,0 +1,233 @@
+"""
+Offline tests for the login session handling of the clients.
+"""
+
+import asyncio
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import orjson
+import pytest
+import requests
+import respx
+import urllib3
+from httpx import Response
+from requests.adapters import HTTPAdapter
+
+from hundred_x import client as client_module
+from hundred_x.async_client import AsyncHundredXClient
+from hundred_x.client import HundredXClient
+from hundred_x.constants import APIS
+from hundred_x.enums import ApiType, Environment
+from tests.test_data import TEST_ADDRESS, TEST_PRIVATE_KEY
+
+REST_URL = "https://api.100x.finance"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(client_module, "SESSION_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def router():
+    sessions = iter(f"session-{i}" for i in range(1, 10))
+    with respx.mock(base_url=REST_URL) as router:
+        router.post("/v1/session/login", name="login").mock(
+            side_effect=lambda request: Response(200, json={"value": next(sessions)})
+        )
+        router.post("/v1/referral/add-referee", name="referral").mock(return_value=Response(200, json={}))
+        yield router
+
+
+def new_client(client_class=HundredXClient, **kwargs):
+    return client_class(Environment.PROD, TEST_PRIVATE_KEY, subaccount_id=1, http2=True, **kwargs)
+
+
+def cookie(request):
+    return request.headers.get("cookie")
+
+
+def test_cache_disabled_by_default(router, cache_dir):
+    with new_client():
+        pass
+    assert router["login"].call_count == 1
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_save_and_load(router, cache_dir):
+    with new_client(cache_session=True) as client:
+        assert client.session_cookie == "session-1"
+    path = cache_dir / f"{Environment.PROD.value}_{TEST_ADDRESS}.json"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert orjson.loads(path.read_bytes())["session_cookie"] == "session-1"
+
+    with new_client(cache_session=True) as client:
+        assert client.session_cookie == "session-1"
+    assert router["login"].call_count == 1
+    assert router["referral"].call_count == 1
+
+
+def test_expired_session(router, cache_dir):
+    with new_client(cache_session=True):
+        pass
+    with mock.patch.object(client_module.time, "time", return_value=time.time() + client_module.SESSION_CACHE_TTL):
+        with new_client(cache_session=True) as client:
+            assert client.session_cookie == "session-2"
+    assert router["login"].call_count == 2
+
+
+def test_logout_deletes_cache(router, cache_dir):
+    router.get("/v1/session/logout").mock(return_value=Response(200, json={}))
+    with new_client(cache_session=True) as client:
+        assert list(cache_dir.iterdir())
+        client.logout()
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_referral_sent_before_close(router):
+    client = new_client()
+    client.close()
+    assert router["referral"].call_count == 1
+
+
+@pytest.mark.parametrize(
+    "call, endpoint",
+    [
+        (lambda client: client.get_orders(), "/v1/orders"),
+        (lambda client: client.get_open_orders(), "/v1/openOrders"),
+        (lambda client: client.get_approved_signers(), "/v1/approved-signers"),
+        (lambda client: client.get_session_status(), "/v1/session/status"),
+    ],
+)
+def test_login_again_on_401(router, call, endpoint):
+    route = router.get(endpoint).mock(
+        side_effect=lambda request: Response(200 if cookie(request) == "connectedAddress=session-2" else 401, json={})
+    )
+    with new_client() as client:
+        assert call(client) == {}
+    assert router["login"].call_count == 2
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "call, endpoint",
+    [
+        (lambda client: client.get_orders(), "/v1/orders"),
+        (lambda client: client.get_session_status(), "/v1/session/status"),
+    ],
+)
+async def test_async_login_again_on_401(router, call, endpoint):
+    route = router.get(endpoint).mock(
+        side_effect=lambda request: Response(200 if cookie(request) == "connectedAddress=session-2" else 401, json={})
+    )
+    async with new_client(AsyncHundredXClient) as client:
+        with mock.patch("asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            assert await call(client) == {}
+    to_thread.assert_called_once_with(client._login_again, "session-1")
+    assert router["login"].call_count == 2
+    assert route.call_count == 2
+
+
+@pytest.fixture
+def dotless_host(monkeypatch):
+    monkeypatch.setitem(APIS[Environment.PROD], ApiType.REST, "http://api-devnet:8080")
+    return "http://api-devnet:8080"
+
+
+def test_cookie_on_dotless_host_http2(dotless_host):
+    with respx.mock(base_url=dotless_host) as router:
+        route = router.get("/v1/products").mock(return_value=Response(200, json=[]))
+        client = HundredXClient(Environment.PROD, http2=True)
+        client._set_session_cookie("session")
+        client.list_products()
+    assert cookie(route.calls.last.request) == "connectedAddress=session"
+
+
+def test_cookie_on_dotless_host_requests(dotless_host):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"[]"
+    client = HundredXClient(Environment.PROD)
+    client._set_session_cookie("session")
+    with mock.patch.object(HTTPAdapter, "send", return_value=response) as send:
+        client.list_products()
+    assert send.call_args.args[0].headers["Cookie"] == "connectedAddress=session"
+
+
+def test_cookie_on_dotless_host_low_latency(dotless_host):
+    client = HundredXClient(Environment.PROD, low_latency=True)
+    client._set_session_cookie("session")
+    body = urllib3.HTTPResponse(body=b"[]", status=200, preload_content=True)
+    with mock.patch.object(urllib3.PoolManager, "request", return_value=body) as pool_request:
+        client.list_products()
+    assert pool_request.call_args.kwargs["headers"]["Cookie"] == "connectedAddress=session"
+
+
+HOMELESS_IMPORT = """
+import pathlib
+
+
+def home(cls):
+    raise RuntimeError("Could not determine home directory.")
+
+
+pathlib.Path.home = classmethod(home)
+import hundred_x.client
+"""
+
+
+def test_import_without_home(tmp_path):
+    subprocess.run(
+        [sys.executable, "-c", HOMELESS_IMPORT],
+        env={**os.environ, "HUNDRED_X_CACHE_DIR": str(tmp_path)},
+        capture_output=True,
+        check=True,
+    )
+
+
+def test_cache_permissions_replaced(router, cache_dir):
+    path = cache_dir / f"{Environment.PROD.value}_{TEST_ADDRESS}.json"
+    path.write_bytes(b"{}")
+    path.chmod(0o644)
+    with new_client(cache_session=True):
+        pass
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert orjson.loads(path.read_bytes())["session_cookie"] == "session-1"
+    assert [p.name for p in cache_dir.iterdir()] == [path.name]
+
+
+def test_concurrent_login_again(router):
+    expired = threading.Barrier(2, timeout=5)
+
+    def orders(request):
+        if cookie(request) == "connectedAddress=session-2":
+            return Response(200, json={})
+        expired.wait()
+        return Response(401, json={})
+
+    router.get("/v1/orders").mock(side_effect=orders)
+    with new_client() as client:
+        with ThreadPoolExecutor(2) as executor:
+            results = list(executor.map(lambda _: client.get_orders(), range(2)))
+    assert results == [{}, {}]
+    assert router["login"].call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_login_again(router):
+    router.get("/v1/orders").mock(
+        side_effect=lambda request: Response(200 if cookie(request) == "connectedAddress=session-2" else 401, json={})
+    )
+    async with new_client(AsyncHundredXClient) as client:
+        results = await asyncio.gather(*(client.get_orders() for _ in range(8)))
+    assert results == [{}] * 8
+    assert router["login"].call_count == 2
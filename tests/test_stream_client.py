@@ -0,0 +1,140 @@
+"""
+Tests for the stream client.
+"""
+
+import asyncio
+import json
+from unittest import mock
+
+import orjson
+import pytest
+import websockets
+
+from hundred_x.enums import Environment
+from hundred_x.stream_client import HundredXStreamClient
+from tests.test_data import TEST_SYMBOL
+
+
+async def echo_stream(websocket):
+    """
+    Answer every subscription with a single frame on the subscribed stream.
+    """
+    async for frame in websocket:
+        request = json.loads(frame)
+        if request["method"] == "SUBSCRIBE":
+            await websocket.send(json.dumps({"result": None, "id": request["id"]}))
+            for stream in request["params"]:
+                await websocket.send(json.dumps({"stream": stream, "data": {"stream": stream}}))
+
+
+@pytest.mark.asyncio
+async def test_subscribe_depth():
+    async with websockets.serve(echo_stream, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        client = HundredXStreamClient(Environment.PROD)
+        client.websocket_url = f"ws://localhost:{port}"
+        async with client:
+            async for book in client.subscribe_depth(TEST_SYMBOL):
+                assert book["stream"] == f"{TEST_SYMBOL}@depth"
+                break
+
+
+def test_websocket_url():
+    client = HundredXStreamClient(Environment.PROD)
+    assert client.websocket_url == "wss://stream.100x.finance"
+
+
+async def stream_without_data(websocket):
+    """
+    Send a frame on the subscribed stream without data before the actual data frame.
+    """
+    async for frame in websocket:
+        request = json.loads(frame)
+        if request["method"] == "SUBSCRIBE":
+            for stream in request["params"]:
+                await websocket.send(json.dumps({"stream": stream, "error": "unavailable"}))
+                await websocket.send(json.dumps({"stream": stream, "data": {"stream": stream}}))
+
+
+@pytest.mark.asyncio
+async def test_skip_frame_without_data():
+    async with websockets.serve(stream_without_data, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        client = HundredXStreamClient(Environment.PROD)
+        client.websocket_url = f"ws://localhost:{port}"
+        async with client:
+            received = []
+            async for trade in client.subscribe_trades(TEST_SYMBOL):
+                received.append(trade)
+                break
+    assert received == [{"stream": f"{TEST_SYMBOL}@trade"}]
+
+
+async def drop_after_subscription(websocket):
+    """
+    Drop the connection on the first subscription, answer normally once reconnected.
+    """
+    drop_after_subscription.connections += 1
+    async for frame in websocket:
+        request = json.loads(frame)
+        if request["method"] == "SUBSCRIBE":
+            for stream in request["params"]:
+                await websocket.send(json.dumps({"stream": stream, "data": {"stream": stream}}))
+            if drop_after_subscription.connections == 1:
+                await websocket.close(code=1011)
+
+
+@pytest.mark.asyncio
+async def test_connection_dropped():
+    drop_after_subscription.connections = 0
+    async with websockets.serve(drop_after_subscription, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        client = HundredXStreamClient(Environment.PROD)
+        client.websocket_url = f"ws://localhost:{port}"
+        async with client:
+            received = []
+            with pytest.raises(websockets.ConnectionClosedError):
+                async for book in client.subscribe_depth(TEST_SYMBOL):
+                    received.append(book)
+            assert received == [{"stream": f"{TEST_SYMBOL}@depth"}]
+            assert client._connection is None
+
+            async for book in client.subscribe_depth(TEST_SYMBOL):
+                assert book == {"stream": f"{TEST_SYMBOL}@depth"}
+                break
+    assert drop_after_subscription.connections == 2
+
+
+async def invalid_frame(websocket):
+    async for _ in websocket:
+        await websocket.send("not json")
+
+
+@pytest.mark.asyncio
+async def test_invalid_frame():
+    async with websockets.serve(invalid_frame, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        client = HundredXStreamClient(Environment.PROD)
+        client.websocket_url = f"ws://localhost:{port}"
+        async with client:
+            with pytest.raises(orjson.JSONDecodeError):
+                async for _ in client.subscribe_trades(TEST_SYMBOL):
+                    pass
+
+
+@pytest.mark.asyncio
+async def test_subscribe_failed():
+    async with websockets.serve(echo_stream, "localhost", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        client = HundredXStreamClient(Environment.PROD)
+        client.websocket_url = f"ws://localhost:{port}"
+        async with client:
+            with mock.patch.object(client, "_send", side_effect=OSError("send failed")) as send:
+                with pytest.raises(OSError):
+                    async for _ in client.subscribe_depth(TEST_SYMBOL):
+                        pass
+            send.assert_called_once_with("SUBSCRIBE", [f"{TEST_SYMBOL}@depth"])
+            books = client.subscribe_depth(TEST_SYMBOL)
+            book = await asyncio.wait_for(books.__anext__(), timeout=5)
+            assert book["stream"] == f"{TEST_SYMBOL}@depth"
+            await books.aclose()
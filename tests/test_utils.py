@@ -0,0 +1,34 @@
+"""
+Tests for the hundred_x.utils module.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from hundred_x.exceptions import UserInputValidationError
+from hundred_x.utils import to_wei
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1, 10**18),
+        (0, 0),
+        (100, 100 * 10**18),
+        (0.1, 10**17),
+        (3000.13, 3000130000000000000000),
+        (4000.73, 4000730000000000000000),
+        (Decimal("2.25"), 2250000000000000000),
+        ("1.5", 1500000000000000000),
+        ("0.000000000000000001", 1),
+    ],
+)
+def test_to_wei(value, expected):
+    assert to_wei(value) == expected
+
+
+@pytest.mark.parametrize("value", [True, False])
+def test_to_wei_rejects_booleans(value):
+    with pytest.raises(UserInputValidationError):
+        to_wei(value)